@@ -29,11 +29,13 @@ def fetch_amrfinderplus_db() -> AMRFinderPlusDatabaseDirFmt:
 def _copy_all(src_dir, des_dir):
     regex = re.compile(r".*(?:AMR_CDS|changes).*")
     # Loop over all files in the source directory
-    for file in os.listdir(src_dir):
-        # Check if the filename does not match the regex pattern and copy the file
-        # from src to des. Files matching the pattern are not needed for the database.
-        if not regex.match(file):
-            duplicate(os.path.join(src_dir, file), os.path.join(des_dir, file))
+    with os.scandir(src_dir) as entries:
+        for entry in entries:
+            # Check if the filename does not match the regex pattern and copy the
+            # file from src to des. Files matching the pattern are not needed for
+            # the database.
+            if entry.is_file() and not regex.match(entry.name):
+                duplicate(entry.path, os.path.join(des_dir, entry.name))
 
 
 def run_amrfinder_fetch():
@@ -42,6 +42,7 @@ class TestFetchAMRFinderPlusDB(TestPluginBase):
         tmp = self.temp_dir.name
         os.mkdir(os.path.join(tmp, "src"))
         os.mkdir(os.path.join(tmp, "des"))
+        os.mkdir(os.path.join(tmp, "src", "subdir"))
 
         with open(os.path.join(tmp, "src", "a"), "w"), open(
             os.path.join(tmp, "src", "AMR_CDS.nto"), "w"
@@ -50,3 +51,5 @@ class TestFetchAMRFinderPlusDB(TestPluginBase):
 
         _copy_all(os.path.join(tmp, "src"), os.path.join(tmp, "des"))
         self.assertTrue(os.path.exists(os.path.join(tmp, "des", "a")))
+        self.assertFalse(os.path.exists(os.path.join(tmp, "des", "AMR_CDS.nto")))
+        self.assertFalse(os.path.exists(os.path.join(tmp, "des", "subdir")))
@@ -7,11 +7,39 @@
 # ----------------------------------------------------------------------------
 import os
 
-import pandas as pd
 from q2_types.feature_data import MixedCaseDNAFASTAFormat, ProteinFASTAFormat
 from qiime2.core.exceptions import ValidationError
 from qiime2.plugin import model
 
+_HEADER_COORDINATES = (
+    "Protein identifier",
+    "Contig id",
+    "Start",
+    "Stop",
+    "Strand",
+    "Gene symbol",
+    "Sequence name",
+    "Scope",
+    "Element type",
+    "Element subtype",
+    "Class",
+    "Subclass",
+    "Method",
+    "Target length",
+    "Reference sequence length",
+    "% Coverage of reference sequence",
+    "% Identity to reference sequence",
+    "Alignment length",
+    "Accession of closest sequence",
+    "Name of closest sequence",
+    "HMM id",
+    "HMM description",
+    "Hierarchy node",
+)
+# Contig id, Start, Stop and Strand are only reported for nucleotide input
+_HEADER = _HEADER_COORDINATES[:1] + _HEADER_COORDINATES[5:]
+_HEADER_JOINED = ", ".join(_HEADER_COORDINATES)
+
 
 class TextFormat(model.TextFileFormat):
     def _validate_(self, level):
@@ -66,45 +94,26 @@ class AMRFinderPlusDatabaseDirFmt(model.DirectoryFormat):
 
 class AMRFinderPlusAnnotationFormat(model.TextFileFormat):
     def _validate(self):
-        header_coordinates = [
-            "Protein identifier",
-            "Contig id",
-            "Start",
-            "Stop",
-            "Strand",
-            "Gene symbol",
-            "Sequence name",
-            "Scope",
-            "Element type",
-            "Element subtype",
-            "Class",
-            "Subclass",
-            "Method",
-            "Target length",
-            "Reference sequence length",
-            "% Coverage of reference sequence",
-            "% Identity to reference sequence",
-            "Alignment length",
-            "Accession of closest sequence",
-            "Name of closest sequence",
-            "HMM id",
-            "HMM description",
-            "Hierarchy node",
-        ]
-        header = header_coordinates[:1] + header_coordinates[5:]
-        try:
-            header_obs = pd.read_csv(str(self), sep="\t", nrows=0).columns.tolist()
-            if header != header_obs and header_coordinates != header_obs:
-                raise ValidationError(
-                    "Header line does not match AMRFinderPlusAnnotationFormat. Must "
-                    "consist of the following values: "
-                    + ", ".join(header_coordinates)
-                    + ".\n\nWhile Contig id, Start, Stop and Strand are optional."
-                    + "\n\nFound instead: "
-                    + ", ".join(header_obs)
-                )
-        except pd.errors.EmptyDataError:
-            pass
+        # Only the header is read, leading lines that are empty or consist of
+        # spaces only are skipped as pd.read_csv used to do
+        with self.open() as f:
+            header_line = next((line for line in f if line.strip(" \r\n")), None)
+
+        # Empty files are valid, e.g. if no AMR genes were found
+        if header_line is None:
+            return
+
+        header_obs = tuple(header_line.rstrip("\r\n").split("\t"))
+
+        if header_obs != _HEADER and header_obs != _HEADER_COORDINATES:
+            raise ValidationError(
+                "Header line does not match AMRFinderPlusAnnotationFormat. Must "
+                "consist of the following values: "
+                + _HEADER_JOINED
+                + ".\n\nWhile Contig id, Start, Stop and Strand are optional."
+                + "\n\nFound instead: "
+                + ", ".join(header_obs)
+            )
 
     def _validate_(self, level):
         self._validate()
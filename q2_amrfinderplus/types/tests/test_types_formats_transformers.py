@@ -6,7 +6,6 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 import os
-import tempfile
 
 from qiime2.core.exceptions import ValidationError
 from qiime2.plugin.testing import TestPluginBase
@@ -21,12 +20,22 @@ from q2_amrfinderplus.types._format import (
 class TestAMRFinderPlusTypesAndFormats(TestPluginBase):
     package = "q2_amrfinderplus.types.tests"
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._paths = {}
+
+    def _data(self, rel):
+        if rel not in self._paths:
+            self._paths[rel] = self.get_data_path(rel)
+        return self._paths[rel]
+
     def test_amrfinderplus_database_directory_format_validate_positive(self):
-        format = AMRFinderPlusDatabaseDirFmt(self.get_data_path("database"), mode="r")
+        format = AMRFinderPlusDatabaseDirFmt(self._data("database"), mode="r")
         format.validate()
 
     def test_amrfinderplus_annotation_format_validate_positive(self):
-        filepath = self.get_data_path(
+        filepath = self._data(
             "annotation/no_coordinates/"
             "aa447c99-ecd9-4c4a-a53b-4df6999815dd_amr_annotations.tsv"
         )
@@ -35,7 +44,7 @@ class TestAMRFinderPlusTypesAndFormats(TestPluginBase):
         format.validate()
 
     def test_amrfinderplus_annotation_format_validate_positive_coordinates(self):
-        filepath = self.get_data_path(
+        filepath = self._data(
             "annotation/coordinates/e026af61-d911-4de3-a957-7e8bf837f30d"
             "_amr_annotations.tsv"
         )
@@ -43,63 +52,109 @@ class TestAMRFinderPlusTypesAndFormats(TestPluginBase):
         format.validate()
 
     def test_amrfinderplus_annotation_format_validate_positive_empty(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_file_path = os.path.join(temp_dir, "amr_annotations.tsv")
-            with open(temp_file_path, "w"):
-                pass
-            format = AMRFinderPlusAnnotationFormat(temp_file_path, mode="r")
+        temp_file_path = os.path.join(self.temp_dir.name, "amr_annotations.tsv")
+        with open(temp_file_path, "w"):
+            pass
+        format = AMRFinderPlusAnnotationFormat(temp_file_path, mode="r")
+        format.validate()
+
+    def test_amrfinderplus_annotation_format_validate_positive_blank_lines(self):
+        src = self._data(
+            "annotation/no_coordinates/"
+            "aa447c99-ecd9-4c4a-a53b-4df6999815dd_amr_annotations.tsv"
+        )
+        path = os.path.join(self.temp_dir.name, "amr_annotations.tsv")
+        with open(src, "r") as f_in, open(path, "w") as f_out:
+            f_out.write("\n\n" + f_in.read())
+
+        format = AMRFinderPlusAnnotationFormat(path, mode="r")
+        format.validate()
+
+    def test_amrfinderplus_annotation_format_validate_positive_bom(self):
+        src = self._data(
+            "annotation/no_coordinates/"
+            "aa447c99-ecd9-4c4a-a53b-4df6999815dd_amr_annotations.tsv"
+        )
+        path = os.path.join(self.temp_dir.name, "amr_annotations.tsv")
+        with open(src, "r", encoding="utf-8") as f_in, open(
+            path, "w", encoding="utf-8-sig"
+        ) as f_out:
+            f_out.write(f_in.read())
+
+        format = AMRFinderPlusAnnotationFormat(path, mode="r")
+        format.validate()
+
+    def test_amrfinderplus_annotation_format_validate_positive_whitespace(self):
+        path = os.path.join(self.temp_dir.name, "amr_annotations.tsv")
+        with open(path, "w") as f:
+            f.write("\n  \n\n")
+
+        format = AMRFinderPlusAnnotationFormat(path, mode="r")
+        format.validate()
+
+    def test_amrfinderplus_annotation_format_validate_tab_line_error(self):
+        src = self._data(
+            "annotation/no_coordinates/"
+            "aa447c99-ecd9-4c4a-a53b-4df6999815dd_amr_annotations.tsv"
+        )
+        path = os.path.join(self.temp_dir.name, "amr_annotations.tsv")
+        with open(src, "r") as f_in, open(path, "w") as f_out:
+            f_out.write("\t\t\n" + f_in.read())
+
+        format = AMRFinderPlusAnnotationFormat(path, mode="r")
+        with self.assertRaisesRegex(ValidationError, "Found instead: , , "):
             format.validate()
 
     def test_amrfinderplus_annotation_format_validation_error(self):
+        path = self._data("annotation_wrong/amr_annotation.tsv")
+        format = AMRFinderPlusAnnotationFormat(path, mode="r")
         with self.assertRaises(ValidationError) as context:
-            path = self.get_data_path("annotation_wrong/amr_annotation.tsv")
-            format = AMRFinderPlusAnnotationFormat(path, mode="r")
             format.validate()
 
-            header_coordinates = [
-                "Protein identifier",
-                "Contig id",
-                "Start",
-                "Stop",
-                "Strand",
-                "Gene symbol",
-                "Sequence name",
-                "Scope",
-                "Element type",
-                "Element subtype",
-                "Class",
-                "Subclass",
-                "Method",
-                "Target length",
-                "Reference sequence length",
-                "% Coverage of reference sequence",
-                "% Identity to reference sequence",
-                "Alignment length",
-                "Accession of closest sequence",
-                "Name of closest sequence",
-                "HMM id",
-                "HMM description",
-            ]
-            expected_message = (
-                "Header line does not match AMRFinderPlusAnnotation format. Must "
-                "consist of the following values: "
-                + ", ".join(header_coordinates)
-                + ".\nWhile Contig id, Start, Stop and Strand are optional."
-                + "\n\nFound instead: "
-                + "Incorrect Header 1, Incorrect Header 2, Incorrect Header 3"
-            )
-
-            self.assertEqual(str(context.exception), expected_message)
+        header_coordinates = [
+            "Protein identifier",
+            "Contig id",
+            "Start",
+            "Stop",
+            "Strand",
+            "Gene symbol",
+            "Sequence name",
+            "Scope",
+            "Element type",
+            "Element subtype",
+            "Class",
+            "Subclass",
+            "Method",
+            "Target length",
+            "Reference sequence length",
+            "% Coverage of reference sequence",
+            "% Identity to reference sequence",
+            "Alignment length",
+            "Accession of closest sequence",
+            "Name of closest sequence",
+            "HMM id",
+            "HMM description",
+            "Hierarchy node",
+        ]
+        expected_message = (
+            "Header line does not match AMRFinderPlusAnnotationFormat. Must "
+            "consist of the following values: "
+            + ", ".join(header_coordinates)
+            + ".\n\nWhile Contig id, Start, Stop and Strand are optional."
+            + "\n\nFound instead: "
+            + "Incorrect Header 1  Incorrect Header 2  Incorrect Header 3"
+        )
+        self.assertIn(expected_message, str(context.exception))
 
     def test_amrfinderplus_annotations_dir_fmt_feature(self):
-        dirpath = self.get_data_path(
+        dirpath = self._data(
             "annotation/coordinates/e026af61-d911-4de3-a957-7e8bf837f30d"
         )
         annotations = AMRFinderPlusAnnotationsDirFmt(dirpath, mode="r")
         assert isinstance(annotations, AMRFinderPlusAnnotationsDirFmt)
 
     def test_amrfinderplus_annotations_dir_fmt_sample(self):
-        dirpath = self.get_data_path("annotation")
+        dirpath = self._data("annotation")
         annotations = AMRFinderPlusAnnotationsDirFmt(dirpath, mode="r")
         assert isinstance(annotations, AMRFinderPlusAnnotationsDirFmt)
 